@@ -4,8 +4,8 @@
 Parses each `.bin` fixture with the Kaitai-compiled Python parser and validates
 the structural fields that Kaitai CAN check against the paired `.json` expected-
 value file.  Fields prefixed with `_` in the JSON are Rust-only (require full-
-file context or imperative logic) and are SKIPPED here; those fields are
-validated in `tests/fixture_tests.rs` instead.
+file context or imperative logic) and are dropped when the JSON is loaded;
+those fields are validated in `tests/fixture_tests.rs` instead.
 
 Prerequisites
 -------------
@@ -22,6 +22,10 @@ Prerequisites
         python3 tests/kaitai_validate.py
 
 The script exits non-zero if any assertion fails.
+
+Fixtures that passed are recorded in `.kaitai_validate_cache.json` and are
+skipped on later runs until the fixture, the generated parser, the kaitaistruct
+runtime, or this script changes.  Pass `--no-cache` to validate everything.
 """
 
 import json
@@ -30,6 +34,7 @@ import sys
 
 FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
 KSY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(KSY_DIR, ".kaitai_validate_cache.json")
 
 # ── Kaitai import ─────────────────────────────────────────────────────────────
 
@@ -60,65 +65,122 @@ def load_kaitai():
 
 # ── Validation helpers ────────────────────────────────────────────────────────
 
-PASS = "\033[32mPASS\033[0m"
-FAIL = "\033[31mFAIL\033[0m"
-SKIP = "\033[33mSKIP\033[0m"
-
-failures = []
-
-
-def check(label, actual, expected, skip=False):
-    if skip:
-        print(f"  {SKIP}  {label}")
-        return
-    if actual == expected:
-        print(f"  {PASS}  {label}: {actual!r}")
-    else:
-        msg = f"{label}: expected {expected!r}, got {actual!r}"
-        print(f"  {FAIL}  {msg}")
-        failures.append(msg)
-
-
-def check_chunks(gmd, expected_chunks):
-    """Validate chunk count, magics, and data sizes."""
-    actual_count = len(gmd.chunks)
+# Colour only for a terminal; piped/CI logs get bare labels.
+if sys.stdout.isatty():
+    PASS = "\033[32mPASS\033[0m"
+    FAIL = "\033[31mFAIL\033[0m"
+    SKIP = "\033[33mSKIP\033[0m"
+else:
+    PASS, FAIL, SKIP = "PASS", "FAIL", "SKIP"
+
+class Report:
+    """Report lines and failure messages collected for one fixture."""
+
+    def __init__(self):
+        self.lines = []
+        self.failures = []
+
+    def emit(self, line=""):
+        self.lines.append(line)
+
+    def fail(self, msg):
+        self.emit(f"  {FAIL}  {msg}")
+        self.failures.append(msg)
+
+    def check(self, label, actual, expected, skip=False):
+        if skip:
+            self.emit(f"  {SKIP}  {label}")
+            return
+        if actual == expected:
+            self.emit(f"  {PASS}  {label}: {actual!r}")
+        else:
+            self.fail(f"{label}: expected {expected!r}, got {actual!r}")
+
+    def check_many(self, prefix, actual, expected):
+        """Check several scalar fields at once; itemize only if any differ."""
+        if actual == expected:
+            fields = ", ".join(f"{k}={v!r}" for k, v in actual.items())
+            self.emit(f"  {PASS}  {prefix}.{{{fields}}}")
+            return
+        for k, v in actual.items():
+            self.check(f"{prefix}.{k}", v, expected[k])
+
+
+# Per-entry fields that live behind pointer_list offsets and so cannot be read
+# by Kaitai; reported as one SKIP line per entry.
+CODE_FIELDS = ("locals_count", "args_count")
+SOND_FIELDS = ("flags", "effects", "volume", "pitch", "group_id", "audio_id")
+TPAG_FIELDS = ("source_x", "source_y", "source_width", "source_height",
+               "target_x", "target_y", "target_width", "target_height",
+               "render_width", "render_height", "texture_page_id")
+SPRT_FIELDS = ("width", "height", "origin_x", "origin_y", "tpag_count")
+FONT_FIELDS = ("size", "bold", "italic", "range_start", "charset",
+               "antialias", "range_end", "tpag_index", "scale_x",
+               "scale_y", "glyph_count")
+
+
+def skip_fields(report, prefix, exp_entry, fields):
+    skipped = [f for f in fields if f in exp_entry]
+    if skipped:
+        report.emit(f"  {SKIP}  {prefix}.{{{','.join(skipped)}}} (pointer-based entry — Kaitai limitation)")
+
+
+def check_chunks(report, chunks, expected_chunks):
+    """Validate chunk count, magics, and data sizes.
+
+    `chunks` is the `(magic, size, body)` list built once per fixture.
+    """
+    actual_count = len(chunks)
     exp_count = len(expected_chunks)
-    check("chunk count", actual_count, exp_count)
+    report.check("chunk count", actual_count, exp_count)
+
+    # Compare whole lists first; only report per chunk when something differs.
+    # `magic` is declared `type: str` in the ksy, so it is already decoded.
+    actual_magics = [magic for magic, _, _ in chunks]
+    actual_sizes = [size for _, size, _ in chunks]
+    exp_magics = [e["magic"] for e in expected_chunks]
+    exp_sizes = [e["data_size"] for e in expected_chunks]
+    if actual_magics == exp_magics and actual_sizes == exp_sizes:
+        report.check("chunks.magic", actual_magics, exp_magics)
+        report.check("chunks.data_size", actual_sizes, exp_sizes)
+        return
 
-    for i, exp in enumerate(expected_chunks):
-        if i >= actual_count:
-            break
-        chunk = gmd.chunks[i]
-        magic = chunk.magic if isinstance(chunk.magic, str) else chunk.magic.decode("ascii")
-        check(f"chunks[{i}].magic", magic, exp["magic"])
-        check(f"chunks[{i}].data_size", chunk.size, exp["data_size"])
+    for i in range(min(actual_count, exp_count)):
+        report.check(f"chunks[{i}].magic", actual_magics[i], exp_magics[i])
+        report.check(f"chunks[{i}].data_size", actual_sizes[i], exp_sizes[i])
 
 
-def check_gen8(gen8_kaitai, exp_gen8):
+def check_gen8(report, gen8_kaitai, exp_gen8):
     """Validate GEN8 numeric fields (Kaitai can read all of these directly)."""
-    check("gen8.bytecode_version", gen8_kaitai.bytecode_version, exp_gen8["bytecode_version"])
-    check("gen8.is_debug_disabled", bool(gen8_kaitai.is_debug_disabled), exp_gen8["is_debug_disabled"])
-    check("gen8.game_id", gen8_kaitai.game_id, exp_gen8["game_id"])
+    actual = {
+        "bytecode_version": gen8_kaitai.bytecode_version,
+        "is_debug_disabled": bool(gen8_kaitai.is_debug_disabled),
+        "game_id": gen8_kaitai.game_id,
+    }
+    expected = {k: exp_gen8[k] for k in actual}
     # ksy uses ide_version_major/minor; JSON uses major/minor
     if "major" in exp_gen8:
-        check("gen8.ide_version_major", gen8_kaitai.ide_version_major, exp_gen8["major"])
+        actual["ide_version_major"] = gen8_kaitai.ide_version_major
+        expected["ide_version_major"] = exp_gen8["major"]
     if "minor" in exp_gen8:
-        check("gen8.ide_version_minor", gen8_kaitai.ide_version_minor, exp_gen8["minor"])
+        actual["ide_version_minor"] = gen8_kaitai.ide_version_minor
+        expected["ide_version_minor"] = exp_gen8["minor"]
     if "room_count" in exp_gen8:
-        check("gen8.room_count", gen8_kaitai.room_count, exp_gen8["room_count"])
+        actual["room_count"] = gen8_kaitai.room_count
+        expected["room_count"] = exp_gen8["room_count"]
+    report.check_many("gen8", actual, expected)
 
 
-def check_strg(strg_kaitai, exp_strg):
+def check_strg(report, strg_kaitai, exp_strg):
     """Validate STRG string count."""
     # strg_kaitai.strings is a pointer_list; count is stored in .strings.count
-    check("strg.count", strg_kaitai.strings.count, exp_strg["count"])
+    report.check("strg.count", strg_kaitai.strings.count, exp_strg["count"])
     # NOTE: string content resolution requires following the pointer to STRG char
     # data — this is listed in _kaitai_limitations.  The _strings field is
     # validated in Rust fixture tests instead.
-    print(f"  {SKIP}  strg._strings (requires StringRef resolution — Kaitai limitation)")
 
 
-def check_code(code_kaitai, exp_code):
+def check_code(report, code_kaitai, exp_code):
     """Validate CODE chunk entry count.
 
     code_body.entries is a pointer_list (count + raw offsets).  The actual
@@ -127,143 +189,114 @@ def check_code(code_kaitai, exp_code):
     Per-entry fields (locals_count, args_count, instructions) are validated in
     the Rust fixture tests instead.
     """
-    check("code.count", code_kaitai.entries.count, exp_code["count"])
+    report.check("code.count", code_kaitai.entries.count, exp_code["count"])
     # Per-entry validation requires following pointer_list offsets (not Kaitai-native):
     for i, exp_entry in enumerate(exp_code.get("entries", [])):
-        prefix = f"code.entries[{i}]"
-        if "locals_count" in exp_entry:
-            print(f"  {SKIP}  {prefix}.locals_count (pointer-based entry — Kaitai limitation)")
-        if "args_count" in exp_entry:
-            print(f"  {SKIP}  {prefix}.args_count (pointer-based entry — Kaitai limitation)")
-        if "_instructions" in exp_entry:
-            print(f"  {SKIP}  {prefix}._instructions (push_body size:0 — Kaitai limitation)")
+        skip_fields(report, f"code.entries[{i}]", exp_entry, CODE_FIELDS)
 
 
-def check_vari(vari_kaitai, exp_vari):
+def check_vari(report, vari_kaitai, exp_vari):
     """Validate VARI chunk structural metadata where accessible."""
     # The VARI body is stored as a raw size-eos blob in game_maker_data.ksy
     # (Kaitai limitation: needs cross-chunk GEN8.bytecode_version to decode).
-    print(f"  {SKIP}  vari fields (stored as raw blob — Kaitai limitation)")
+    report.emit(f"  {SKIP}  vari fields (stored as raw blob — Kaitai limitation)")
 
 
-def check_func(func_kaitai, exp_func):
+def check_func(report, func_kaitai, exp_func):
     """Validate FUNC chunk structural metadata where accessible."""
-    print(f"  {SKIP}  func fields (stored as raw blob — Kaitai limitation)")
+    report.emit(f"  {SKIP}  func fields (stored as raw blob — Kaitai limitation)")
 
 
-def check_scpt(scpt_kaitai, exp_scpt):
+def check_scpt(report, scpt_kaitai, exp_scpt):
     """Validate SCPT chunk entry count.
 
     scpt_body.scripts is a pointer_list; actual script entries are accessed via
     absolute seek (same limitation as CODE entries).  We can only check count here.
     """
-    check("scpt.count", scpt_kaitai.scripts.count, exp_scpt["count"])
+    report.check("scpt.count", scpt_kaitai.scripts.count, exp_scpt["count"])
     for i, exp_entry in enumerate(exp_scpt.get("entries", [])):
         prefix = f"scpt.entries[{i}]"
         if "code_id" in exp_entry:
-            print(f"  {SKIP}  {prefix}.code_id (pointer-based entry — Kaitai limitation)")
-        print(f"  {SKIP}  {prefix}._name (StringRef — Kaitai limitation)")
+            report.emit(f"  {SKIP}  {prefix}.code_id (pointer-based entry — Kaitai limitation)")
 
 
-def check_glob(glob_kaitai, exp_glob):
+def check_glob(report, glob_kaitai, exp_glob):
     """Validate GLOB chunk: flat count + script_ids array (all Kaitai-accessible)."""
-    check("glob.count", glob_kaitai.count, exp_glob["count"])
-    for i, expected_id in enumerate(exp_glob.get("script_ids", [])):
-        check(f"glob.script_ids[{i}]", glob_kaitai.script_ids[i], expected_id)
+    report.check("glob.count", glob_kaitai.count, exp_glob["count"])
+    exp_ids = exp_glob.get("script_ids", [])
+    actual_ids = list(glob_kaitai.script_ids[:len(exp_ids)])
+    if actual_ids == exp_ids:
+        report.check("glob.script_ids", actual_ids, exp_ids)
+        return
+    for i, expected_id in enumerate(exp_ids):
+        actual_id = actual_ids[i] if i < len(actual_ids) else None
+        report.check(f"glob.script_ids[{i}]", actual_id, expected_id)
 
 
-def check_lang(lang_kaitai, exp_lang):
+def check_lang(report, lang_kaitai, exp_lang):
     """Validate LANG chunk: flat entry_count + count + entries (StringRefs skipped)."""
-    check("lang.entry_count", lang_kaitai.entry_count, exp_lang["entry_count"])
-    check("lang.count", lang_kaitai.actual_count, exp_lang["count"])
-    for i, exp_entry in enumerate(exp_lang.get("entries", [])):
-        prefix = f"lang.entries[{i}]"
-        # name and region are raw u32 StringRef offsets — cannot resolve without STRG seek
-        if "_name" in exp_entry:
-            print(f"  {SKIP}  {prefix}._name (StringRef — Kaitai limitation)")
-        if "_region" in exp_entry:
-            print(f"  {SKIP}  {prefix}._region (StringRef — Kaitai limitation)")
-
-
-def check_seqn(seqn_kaitai, exp_seqn):
+    report.check_many(
+        "lang",
+        {"entry_count": lang_kaitai.entry_count, "count": lang_kaitai.actual_count},
+        {"entry_count": exp_lang["entry_count"], "count": exp_lang["count"]},
+    )
+
+
+def check_seqn(report, seqn_kaitai, exp_seqn):
     """Validate SEQN chunk: version field + count (entries are pointer-based)."""
-    check("seqn.version", seqn_kaitai.version, exp_seqn["version"])
-    check("seqn.count", seqn_kaitai.sequences.count, exp_seqn["count"])
-    for i, exp_entry in enumerate(exp_seqn.get("_entries", [])):
-        prefix = f"seqn.entries[{i}]"
-        if "_name" in exp_entry:
-            print(f"  {SKIP}  {prefix}._name (pointer-based entry — Kaitai limitation)")
+    report.check_many(
+        "seqn",
+        {"version": seqn_kaitai.version, "count": seqn_kaitai.sequences.count},
+        {"version": exp_seqn["version"], "count": exp_seqn["count"]},
+    )
 
 
-def check_shdr(shdr_kaitai, exp_shdr):
+def check_shdr(report, shdr_kaitai, exp_shdr):
     """Validate SHDR chunk entry count."""
-    check("shdr.count", shdr_kaitai.shaders.count, exp_shdr["count"])
-    for i, exp_entry in enumerate(exp_shdr.get("_entries", [])):
-        prefix = f"shdr.entries[{i}]"
-        if "_name" in exp_entry:
-            print(f"  {SKIP}  {prefix}._name (pointer-based entry — Kaitai limitation)")
+    report.check("shdr.count", shdr_kaitai.shaders.count, exp_shdr["count"])
 
 
-def check_bgnd(bgnd_kaitai, exp_bgnd):
+def check_bgnd(report, bgnd_kaitai, exp_bgnd):
     """Validate BGND chunk entry count."""
-    check("bgnd.count", bgnd_kaitai.backgrounds.count, exp_bgnd["count"])
-    for i, exp_entry in enumerate(exp_bgnd.get("_entries", [])):
-        prefix = f"bgnd.entries[{i}]"
-        if "_name" in exp_entry:
-            print(f"  {SKIP}  {prefix}._name (pointer-based entry — Kaitai limitation)")
+    report.check("bgnd.count", bgnd_kaitai.backgrounds.count, exp_bgnd["count"])
 
 
-def check_sond(sond_kaitai, exp_sond):
+def check_sond(report, sond_kaitai, exp_sond):
     """Validate SOND chunk entry count (entries are pointer-based)."""
-    check("sond.count", sond_kaitai.sounds.count, exp_sond["count"])
+    report.check("sond.count", sond_kaitai.sounds.count, exp_sond["count"])
     for i, exp_entry in enumerate(exp_sond.get("entries", [])):
-        prefix = f"sond.entries[{i}]"
-        for field in ("_name", "flags", "_type_name", "_file_name", "effects", "volume", "pitch", "group_id", "audio_id"):
-            if field in exp_entry:
-                print(f"  {SKIP}  {prefix}.{field} (pointer-based entry — Kaitai limitation)")
+        skip_fields(report, f"sond.entries[{i}]", exp_entry, SOND_FIELDS)
 
 
-def check_audo(audo_kaitai, exp_audo):
+def check_audo(report, audo_kaitai, exp_audo):
     """Validate AUDO chunk entry count (entries are pointer-based)."""
-    check("audo.count", audo_kaitai.entries.count, exp_audo["count"])
+    report.check("audo.count", audo_kaitai.entries.count, exp_audo["count"])
     for i, exp_entry in enumerate(exp_audo.get("entries", [])):
         prefix = f"audo.entries[{i}]"
         if "length" in exp_entry:
-            print(f"  {SKIP}  {prefix}.length (pointer-based entry — Kaitai limitation)")
+            report.emit(f"  {SKIP}  {prefix}.length (pointer-based entry — Kaitai limitation)")
 
 
-def check_txtr(txtr_kaitai, exp_txtr):
+def check_txtr(report, txtr_kaitai, exp_txtr):
     """Validate TXTR chunk entry count (entries are pointer-based)."""
-    check("txtr.count", txtr_kaitai.textures.count, exp_txtr["count"])
-    for i, exp_entry in enumerate(exp_txtr.get("_entries", [])):
-        prefix = f"txtr.entries[{i}]"
-        if "data_offset" in exp_entry:
-            print(f"  {SKIP}  {prefix}.data_offset (pointer-based entry — Kaitai limitation)")
+    report.check("txtr.count", txtr_kaitai.textures.count, exp_txtr["count"])
 
 
-def check_tpag(tpag_kaitai, exp_tpag):
+def check_tpag(report, tpag_kaitai, exp_tpag):
     """Validate TPAG chunk entry count (entries are pointer-based)."""
-    check("tpag.count", tpag_kaitai.items.count, exp_tpag["count"])
+    report.check("tpag.count", tpag_kaitai.items.count, exp_tpag["count"])
     for i, exp_entry in enumerate(exp_tpag.get("entries", [])):
-        prefix = f"tpag.entries[{i}]"
-        for field in ("source_x", "source_y", "source_width", "source_height",
-                      "target_x", "target_y", "target_width", "target_height",
-                      "render_width", "render_height", "texture_page_id"):
-            if field in exp_entry:
-                print(f"  {SKIP}  {prefix}.{field} (pointer-based entry — Kaitai limitation)")
+        skip_fields(report, f"tpag.entries[{i}]", exp_entry, TPAG_FIELDS)
 
 
-def check_sprt(sprt_kaitai, exp_sprt):
+def check_sprt(report, sprt_kaitai, exp_sprt):
     """Validate SPRT chunk entry count (entries are pointer-based)."""
-    check("sprt.count", sprt_kaitai.sprites.count, exp_sprt["count"])
+    report.check("sprt.count", sprt_kaitai.sprites.count, exp_sprt["count"])
     for i, exp_entry in enumerate(exp_sprt.get("entries", [])):
-        prefix = f"sprt.entries[{i}]"
-        for field in ("_name", "width", "height", "origin_x", "origin_y", "tpag_count"):
-            if field in exp_entry:
-                print(f"  {SKIP}  {prefix}.{field} (pointer-based entry — Kaitai limitation)")
+        skip_fields(report, f"sprt.entries[{i}]", exp_entry, SPRT_FIELDS)
 
 
-def check_optn(optn_kaitai, exp_optn):
+def check_optn(report, optn_kaitai, exp_optn):
     """Validate OPTN chunk: flags and constant_count are directly accessible.
 
     The OPTN body is flat (not pointer-based): flags(u32) + reserved(56B) +
@@ -271,143 +304,127 @@ def check_optn(optn_kaitai, exp_optn):
     The constant entries themselves are flat too, but their StringRef name/value
     fields require STRG resolution.
     """
-    check("optn.flags", optn_kaitai.flags, exp_optn["flags"])
-    check("optn.constant_count", optn_kaitai.constant_count, exp_optn["constant_count"])
-    for i, exp_const in enumerate(exp_optn.get("constants", [])):
-        prefix = f"optn.constants[{i}]"
-        if "_name" in exp_const:
-            print(f"  {SKIP}  {prefix}._name (StringRef — Kaitai limitation)")
-        if "_value" in exp_const:
-            print(f"  {SKIP}  {prefix}._value (StringRef — Kaitai limitation)")
+    report.check_many(
+        "optn",
+        {"flags": optn_kaitai.flags, "constant_count": optn_kaitai.constant_count},
+        {"flags": exp_optn["flags"], "constant_count": exp_optn["constant_count"]},
+    )
 
 
-def check_font(font_kaitai, exp_font):
+def check_font(report, font_kaitai, exp_font):
     """Validate FONT chunk entry count (entries are pointer-based)."""
-    check("font.count", font_kaitai.fonts.count, exp_font["count"])
+    report.check("font.count", font_kaitai.fonts.count, exp_font["count"])
     for i, exp_entry in enumerate(exp_font.get("entries", [])):
         prefix = f"font.entries[{i}]"
-        for field in ("_name", "_display_name", "size", "bold", "italic",
-                      "range_start", "charset", "antialias", "range_end",
-                      "tpag_index", "scale_x", "scale_y", "glyph_count"):
-            if field in exp_entry:
-                print(f"  {SKIP}  {prefix}.{field} (pointer-based entry — Kaitai limitation)")
-        for j, _ in enumerate(exp_entry.get("glyphs", [])):
-            print(f"  {SKIP}  {prefix}.glyphs[{j}] (pointer-based glyph — Kaitai limitation)")
+        skip_fields(report, prefix, exp_entry, FONT_FIELDS)
+        if exp_entry.get("glyphs"):
+            report.emit(f"  {SKIP}  {prefix}.glyphs[0..{len(exp_entry['glyphs'])}] (pointer-based glyph — Kaitai limitation)")
 
 
-def check_objt(objt_kaitai, exp_objt):
+def check_objt(report, objt_kaitai, exp_objt):
     """Validate OBJT chunk entry count (entries are pointer-based)."""
-    check("objt.count", objt_kaitai.objects.count, exp_objt["count"])
+    report.check("objt.count", objt_kaitai.objects.count, exp_objt["count"])
     for i, exp_entry in enumerate(exp_objt.get("entries", [])):
         prefix = f"objt.entries[{i}]"
-        print(f"  {SKIP}  {prefix} fields (pointer-based entry — Kaitai limitation)")
+        report.emit(f"  {SKIP}  {prefix} fields (pointer-based entry — Kaitai limitation)")
 
 
-def check_room(room_kaitai, exp_room):
+def check_room(report, room_kaitai, exp_room):
     """Validate ROOM chunk entry count (entries are pointer-based)."""
-    check("room.count", room_kaitai.rooms.count, exp_room["count"])
+    report.check("room.count", room_kaitai.rooms.count, exp_room["count"])
     for i, exp_entry in enumerate(exp_room.get("entries", [])):
         prefix = f"room.entries[{i}]"
-        print(f"  {SKIP}  {prefix} fields (pointer-based entry — Kaitai limitation)")
+        report.emit(f"  {SKIP}  {prefix} fields (pointer-based entry — Kaitai limitation)")
 
 
 # ── Per-fixture validation ────────────────────────────────────────────────────
 
+def _strip_rust_only(obj):
+    """json object_hook: drop `_`-prefixed Rust-only fields from each object."""
+    return {k: v for k, v in obj.items() if not k.startswith("_") or k == "_kaitai_limitations"}
+
+
+# JSON key → (chunk magic, validator), in report order.
+VALIDATORS = {
+    "gen8": ("GEN8", check_gen8),
+    "strg": ("STRG", check_strg),
+    "code": ("CODE", check_code),
+    "vari": ("VARI", check_vari),
+    "func": ("FUNC", check_func),
+    "scpt": ("SCPT", check_scpt),
+    "glob": ("GLOB", check_glob),
+    "lang": ("LANG", check_lang),
+    "seqn": ("SEQN", check_seqn),
+    "shdr": ("SHDR", check_shdr),
+    "bgnd": ("BGND", check_bgnd),
+    "sond": ("SOND", check_sond),
+    "audo": ("AUDO", check_audo),
+    "txtr": ("TXTR", check_txtr),
+    "tpag": ("TPAG", check_tpag),
+    "sprt": ("SPRT", check_sprt),
+    "optn": ("OPTN", check_optn),
+    "font": ("FONT", check_font),
+    "objt": ("OBJT", check_objt),
+    "room": ("ROOM", check_room),
+}
+
+
 def validate_fixture(fixture_name, gmd_mod, KaitaiStream, BytesIO):
+    """Validate one fixture; returns its `(output_lines, failures)`.
+
+    An unexpected exception is recorded as a failure of this fixture so the
+    remaining fixtures are still validated and reported.
+    """
+    report = Report()
+    try:
+        _validate_fixture(report, fixture_name, gmd_mod, KaitaiStream, BytesIO)
+    except Exception as e:
+        report.fail(f"{fixture_name}: {type(e).__name__}: {e}")
+    return report.lines, report.failures
+
+
+def _validate_fixture(report, fixture_name, gmd_mod, KaitaiStream, BytesIO):
     bin_path = os.path.join(FIXTURES_DIR, f"{fixture_name}.bin")
     json_path = os.path.join(FIXTURES_DIR, f"{fixture_name}.json")
 
     if not os.path.exists(bin_path):
-        print(f"SKIP  {fixture_name}: {bin_path} not found")
+        report.emit(f"SKIP  {fixture_name}: {bin_path} not found")
         return
     if not os.path.exists(json_path):
-        print(f"SKIP  {fixture_name}: {json_path} not found")
+        report.emit(f"SKIP  {fixture_name}: {json_path} not found")
         return
 
     with open(bin_path, "rb") as f:
         raw = f.read()
     with open(json_path) as f:
-        exp = json.load(f)
+        exp = json.load(f, object_hook=_strip_rust_only)
 
-    print(f"\n── {fixture_name} ({len(raw)} bytes) ──")
+    report.emit(f"\n── {fixture_name} ({len(raw)} bytes) ──")
 
     # File size
-    check("file_size", len(raw), exp["file_size"])
+    report.check("file_size", len(raw), exp["file_size"])
 
     # Parse with Kaitai
     try:
         gmd = gmd_mod.GameMakerData(KaitaiStream(BytesIO(raw)))
     except Exception as e:
-        failures.append(f"{fixture_name}: Kaitai parse failed: {e}")
-        print(f"  {FAIL}  Kaitai parse failed: {e}")
+        report.fail(f"{fixture_name}: Kaitai parse failed: {e}")
         return
 
+    # Walk the chunk list once; both the chunk table check and the per-chunk
+    # validators work from these tuples.
+    chunks = [(c.magic, c.size, c.body) for c in gmd.chunks]
+
     # Chunks
     if "chunks" in exp:
-        check_chunks(gmd, exp["chunks"])
+        check_chunks(report, chunks, exp["chunks"])
 
     # Find specific chunks by magic
-    chunk_map = {(c.magic if isinstance(c.magic, str) else c.magic.decode("ascii")): c for c in gmd.chunks}
-
-    if "gen8" in exp and "GEN8" in chunk_map:
-        check_gen8(chunk_map["GEN8"].body, exp["gen8"])
-
-    if "strg" in exp and "STRG" in chunk_map:
-        check_strg(chunk_map["STRG"].body, exp["strg"])
-
-    if "code" in exp and "CODE" in chunk_map:
-        check_code(chunk_map["CODE"].body, exp["code"])
+    bodies = {magic: body for magic, _, body in chunks}
 
-    if "vari" in exp and "VARI" in chunk_map:
-        check_vari(chunk_map["VARI"].body, exp["vari"])
-
-    if "func" in exp and "FUNC" in chunk_map:
-        check_func(chunk_map["FUNC"].body, exp["func"])
-
-    if "scpt" in exp and "SCPT" in chunk_map:
-        check_scpt(chunk_map["SCPT"].body, exp["scpt"])
-
-    if "glob" in exp and "GLOB" in chunk_map:
-        check_glob(chunk_map["GLOB"].body, exp["glob"])
-
-    if "lang" in exp and "LANG" in chunk_map:
-        check_lang(chunk_map["LANG"].body, exp["lang"])
-
-    if "seqn" in exp and "SEQN" in chunk_map:
-        check_seqn(chunk_map["SEQN"].body, exp["seqn"])
-
-    if "shdr" in exp and "SHDR" in chunk_map:
-        check_shdr(chunk_map["SHDR"].body, exp["shdr"])
-
-    if "bgnd" in exp and "BGND" in chunk_map:
-        check_bgnd(chunk_map["BGND"].body, exp["bgnd"])
-
-    if "sond" in exp and "SOND" in chunk_map:
-        check_sond(chunk_map["SOND"].body, exp["sond"])
-
-    if "audo" in exp and "AUDO" in chunk_map:
-        check_audo(chunk_map["AUDO"].body, exp["audo"])
-
-    if "txtr" in exp and "TXTR" in chunk_map:
-        check_txtr(chunk_map["TXTR"].body, exp["txtr"])
-
-    if "tpag" in exp and "TPAG" in chunk_map:
-        check_tpag(chunk_map["TPAG"].body, exp["tpag"])
-
-    if "sprt" in exp and "SPRT" in chunk_map:
-        check_sprt(chunk_map["SPRT"].body, exp["sprt"])
-
-    if "optn" in exp and "OPTN" in chunk_map:
-        check_optn(chunk_map["OPTN"].body, exp["optn"])
-
-    if "font" in exp and "FONT" in chunk_map:
-        check_font(chunk_map["FONT"].body, exp["font"])
-
-    if "objt" in exp and "OBJT" in chunk_map:
-        check_objt(chunk_map["OBJT"].body, exp["objt"])
-
-    if "room" in exp and "ROOM" in chunk_map:
-        check_room(chunk_map["ROOM"].body, exp["room"])
+    for key, (magic, validate) in VALIDATORS.items():
+        if key in exp and magic in bodies:
+            validate(report, bodies[magic], exp[key])
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
@@ -431,20 +448,82 @@ FIXTURES = [
 ]
 
 
+# ── Incremental cache ─────────────────────────────────────────────────────────
+
+def load_cache(key):
+    """Return `{fixture: signature}` for fixtures that last passed under `key`."""
+    try:
+        with open(CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("key") != key:
+        return {}
+    return cache.get("passed", {})
+
+
+def save_cache(key, passed):
+    tmp_path = CACHE_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"key": key, "passed": passed}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def fixture_signature(fixture_name):
+    """mtimes of the fixture's `.bin` and `.json`, or None if either is missing."""
+    try:
+        return [
+            os.stat(os.path.join(FIXTURES_DIR, f"{fixture_name}{ext}")).st_mtime_ns
+            for ext in (".bin", ".json")
+        ]
+    except OSError:
+        return None
+
+
 def main():
     gmd_mod, KaitaiStream, BytesIO = load_kaitai()
-
-    for name in FIXTURES:
-        validate_fixture(name, gmd_mod, KaitaiStream, BytesIO)
+    import kaitaistruct
+
+    # A different runtime, a regenerated parser, or an edited validator
+    # invalidates every entry.
+    key = [
+        kaitaistruct.__version__,
+        os.stat(gmd_mod.__file__).st_mtime_ns,
+        os.stat(__file__).st_mtime_ns,
+    ]
+    use_cache = "--no-cache" not in sys.argv[1:]
+    cached = load_cache(key) if use_cache else {}
+
+    signatures = {name: fixture_signature(name) for name in FIXTURES}
+    pending = [
+        name for name in FIXTURES
+        if signatures[name] is None or cached.get(name) != signatures[name]
+    ]
+    passed = {name: cached[name] for name in FIXTURES if name not in pending}
+    unchanged = len(passed)
+    if unchanged:
+        print(f"{SKIP}  {unchanged} fixture(s) unchanged since last pass (--no-cache to force)")
+
+    # Each fixture's report is collected and written in one piece.
+    all_failures = []
+    for name in pending:
+        lines, failures = validate_fixture(name, gmd_mod, KaitaiStream, BytesIO)
+        print("\n".join(lines))
+        all_failures.extend(failures)
+        if not failures and signatures[name] is not None:
+            passed[name] = signatures[name]
+
+    if use_cache:
+        save_cache(key, passed)
 
     print()
-    if failures:
-        print(f"FAILED: {len(failures)} assertion(s) failed:")
-        for f in failures:
+    if all_failures:
+        print(f"FAILED: {len(all_failures)} assertion(s) failed:")
+        for f in all_failures:
             print(f"  - {f}")
         sys.exit(1)
     else:
-        print(f"All checks passed ({len(FIXTURES)} fixtures).")
+        print(f"All checks passed ({len(pending)} validated, {unchanged} unchanged).")
 
 
 if __name__ == "__main__":